@@ -29,8 +29,8 @@ def plot(i, f, x, y, bx, by, error):
     plt.close('all')
 
 
-x = np.random.normal(0, 0.3, size=COUNT)
-y = np.random.normal(0, 0.3, size=COUNT)
+rng = np.random.default_rng()
+x, y = rng.normal(0, 0.3, size=(2, COUNT))
 boro_master = BorovickaProjection(a0=0, x0=0, y0=0, A=0, F=0, V=1.0001, S=0.00677, D=0.0953, P=2.20e-6, Q=0.00638, epsilon=0, E=0)
 boro_test = BorovickaProjection(a0=0, x0=0.1, y0=0, A=0, F=0, V=1, S=0.00677, D=0.0953, P=2e-4, Q=0.00638, epsilon=0, E=0)
 boro_ident = BorovickaProjection()
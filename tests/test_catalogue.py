@@ -1,3 +1,5 @@
+import datetime
+import numpy as np
 import pytest
 
 from vasco.models.sensordata import SensorData
@@ -19,6 +21,27 @@ class TestCatalogue:
     def test_dimensions(self, hyg30):
         assert hyg30.skycoord.size == 5068
 
+    def test_altaz_reused(self, hyg30, sd):
+        first = hyg30.altaz(sd.location, sd.timestamp, masked=False)
+        assert hyg30.altaz(sd.location, sd.timestamp, masked=False) is first
+
+    def test_altaz_new_time(self, hyg30, sd):
+        first = hyg30.altaz(sd.location, sd.timestamp, masked=False)
+        later = hyg30.altaz(sd.location, sd.timestamp + datetime.timedelta(hours=1), masked=False)
+        assert later is not first
+        assert not np.allclose(later.az.radian, first.az.radian)
+
+    def test_altaz_invalidated_by_update_coord(self, hyg30, sd):
+        first = hyg30.altaz(sd.location, sd.timestamp, masked=False)
+        hyg30.update_coord()
+        assert hyg30.altaz(sd.location, sd.timestamp, masked=False) is not first
+
+    def test_altaz_invalidated_by_cull(self, hyg30, sd):
+        hyg30.altaz(sd.location, sd.timestamp, masked=False)
+        hyg30.stars.loc[hyg30.stars.index[:100], 'use'] = False
+        hyg30.cull()
+        assert hyg30.altaz(sd.location, sd.timestamp, masked=False).size == 5068 - 100
+
 
 class TestSensorData:
     def test_dimensions(self, sd):
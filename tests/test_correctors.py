@@ -0,0 +1,38 @@
+import numpy as np
+
+from vasco.correctors import KernelSmoother, kernels
+
+
+class TestKernelSmoother:
+    @staticmethod
+    def brute_force(points, values, nodes, bandwidth):
+        result = np.empty(shape=(nodes.shape[0], values.shape[1]))
+        for i, node in enumerate(nodes):
+            weights = kernels.nexp(np.sqrt(np.sum((points - node)**2, axis=1)) / bandwidth)
+            result[i] = np.sum(weights[:, np.newaxis] * values, axis=0) / np.sum(weights)
+        return result
+
+    def test_values(self):
+        rng = np.random.default_rng(0)
+        points = rng.uniform(-1, 1, size=(50, 2))
+        values = rng.normal(size=(50, 2))
+        nodes = rng.uniform(-1, 1, size=(20, 2))
+        smoother = KernelSmoother(points, values, kernel=kernels.nexp, bandwidth=0.2)
+        assert np.allclose(smoother(nodes), self.brute_force(points, values, nodes, 0.2))
+
+    def test_masked_nodes(self):
+        points = np.array([[0, 0], [0.5, 0.5]])
+        values = np.array([[1.0], [2.0]])
+        nodes = np.ma.masked_array([[0, 0], [1, 1]], mask=[[False, False], [True, True]])
+        result = KernelSmoother(points, values, bandwidth=0.1)(nodes)
+        assert result.shape == (2, 1)
+        assert not result.mask[0, 0]
+        assert result.mask[1, 0]
+
+    def test_masked_no_influence(self):
+        points = np.array([[0, 0]])
+        values = np.array([[1.0]])
+        nodes = np.ma.masked_array([[0, 0], [1, 1]], mask=False)
+        result = KernelSmoother(points, values, bandwidth=0.001)(nodes)
+        assert not result.mask[0, 0]
+        assert result.mask[1, 0]
@@ -0,0 +1,129 @@
+import math
+import numpy as np
+import pytest
+
+from amosutils.projections import BorovickaProjection
+
+from vasco.matchers.base import Matcher
+from vasco.matchers.matchmaker import Matchmaker
+from vasco.models.catalogue import Catalogue
+from vasco.models.sensordata import SensorData
+from vasco.utilities import load_yaml
+
+
+class TestErrors:
+    def test_rms_error(self):
+        assert np.isclose(Matcher.rms_error(np.array([3.0, 4.0])), math.sqrt(12.5))
+
+    def test_rms_error_empty(self):
+        assert np.isnan(Matcher.rms_error(np.empty(shape=(0,))))
+
+    def test_rms_max_error(self):
+        errors = np.array([0.1, 0.5, 0.2])
+        rms, maximum = Matcher.rms_max_error(errors)
+        assert np.isclose(rms, np.sqrt(np.mean(np.square(errors))))
+        assert maximum == 0.5
+
+
+PARAMETERS = ['x0', 'y0', 'a0', 'A', 'F', 'V', 'S', 'D', 'P', 'Q', 'epsilon', 'E']
+
+
+@pytest.fixture(scope='module')
+def calibration():
+    with open('calibrations/DRGR.yaml') as file:
+        return load_yaml(file)
+
+
+def load_matchmaker(calibration):
+    sensor_data = SensorData.load_YAML('data/20220531_055655.yaml')
+    sensor_data.set_shifter_scales(calibration['pixels']['xs'], calibration['pixels']['ys'])
+    return Matchmaker(sensor_data.location, sensor_data.timestamp,
+                      catalogue=Catalogue.load('catalogues/HYG30.tsv'), sensor_data=sensor_data)
+
+
+@pytest.fixture(scope='module')
+def matchmaker(calibration):
+    return load_matchmaker(calibration)
+
+
+@pytest.fixture(scope='module')
+def parameters(calibration):
+    return np.array([calibration['projection']['parameters'][key] for key in PARAMETERS], dtype=float)
+
+
+@pytest.fixture(scope='module')
+def counselor(calibration, parameters):
+    # Pairing masks the sensor data, so pair a private Matchmaker instead of the shared one
+    matchmaker = load_matchmaker(calibration)
+    projection = BorovickaProjection(*parameters)
+    matchmaker.mask_sensor_data(matchmaker.position_errors(projection, masked=False) < np.radians(0.5))
+    return matchmaker.pair(projection)
+
+
+def loss(matcher, parameters):
+    return matcher.rms_error(matcher.position_errors(BorovickaProjection(*parameters), masked=True))
+
+
+class TestMatchmaker:
+    def test_minimize_does_not_increase_loss(self, matchmaker, parameters):
+        x0 = parameters.copy()
+        x0[0] += 0.02
+        x0[2] += 0.005
+        x0[5] *= 1.005
+        mask = np.isin(PARAMETERS, ['x0', 'y0', 'a0', 'V', 'S', 'D'])
+
+        result = np.array(matchmaker.minimize(x0=x0, maxiter=5, mask=mask))
+        assert loss(matchmaker, result) <= loss(matchmaker, x0)
+        assert np.array_equal(result[~mask], x0[~mask])
+
+    def test_minimize_releases_altaz(self, matchmaker, parameters):
+        mask = np.isin(PARAMETERS, ['x0', 'y0'])
+        matchmaker.minimize(x0=parameters, maxiter=1, mask=mask)
+        assert matchmaker._altaz is None
+
+
+class TestCounselor:
+    def test_minimize_reduces_loss_within_bounds(self, counselor, parameters):
+        x0 = parameters.copy()
+        x0[0] += 0.05
+        x0[2] += 0.01
+        x0[5] *= 1.01
+        # Start epsilon on its lower bound so the solver has to keep it there or move inwards
+        x0[10] = 0
+        mask = np.isin(PARAMETERS, ['x0', 'y0', 'a0', 'V', 'S', 'D', 'epsilon', 'E'])
+
+        result = np.array(counselor.minimize(x0=x0, maxiter=20, mask=mask))
+        assert loss(counselor, result) < loss(counselor, x0)
+        assert result[5] >= 0.001
+        assert result[10] >= 0
+        assert np.array_equal(result[~mask], x0[~mask])
+
+    @pytest.mark.parametrize('maxiter', [1, 2, 5])
+    def test_minimize_does_not_increase_loss(self, counselor, parameters, maxiter):
+        perturbed = parameters.copy()
+        perturbed[0] += 0.02
+        perturbed[2] += 0.005
+        perturbed[5] *= 1.005
+        mask = np.isin(PARAMETERS, ['x0', 'y0', 'a0', 'V', 'S', 'D'])
+
+        # Both from the calibrated optimum, where any step is likely to be worse, and from near it
+        for x0 in (parameters, perturbed):
+            result = np.array(counselor.minimize(x0=x0, maxiter=maxiter, mask=mask))
+            assert loss(counselor, result) <= loss(counselor, x0)
+
+    def test_residuals_finite_outside_domain(self, counselor, parameters):
+        mask = np.isin(PARAMETERS, ['A'])
+        func = counselor._build_residual_function(parameters, mask)
+        residuals = func(np.array([1.5]))
+        assert residuals.shape == (counselor.catalogue.count_valid,)
+        assert np.all(np.isfinite(residuals))
+
+    def test_minimize_keeps_tilt_valid(self, counselor, parameters):
+        x0 = parameters.copy()
+        x0[0] += 0.05
+        x0[3] = 0.999
+        mask = np.isin(PARAMETERS, ['x0', 'y0', 'a0', 'A', 'F', 'V'])
+
+        result = np.array(counselor.minimize(x0=x0, maxiter=20, mask=mask))
+        assert -1 <= result[3] <= 1
+        assert np.isfinite(loss(counselor, result))
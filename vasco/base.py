@@ -1,7 +1,7 @@
 import dotmap
 import numpy as np
 
-from matplotlib import pyplot as plt
+from matplotlib import style
 from collections import OrderedDict
 
 from PyQt6.QtWidgets import QMainWindow
@@ -16,12 +16,16 @@ class MainWindowBase(QMainWindow, Ui_MainWindow):
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        plt.style.use('dark_background')
+        style.use('dark_background')
         self.position_errors = None
         self.magnitude_errors = None
+        self.valid_magnitude_errors = False
+        self.valid_position_smoother = False
+        self.valid_magnitude_smoother = False
         self.location = None
         self.time = None
         self.projection = None
+        self.projection_parameters = None
         self.calibration = None
         self.matcher = None
 
@@ -41,8 +45,17 @@ class MainWindowBase(QMainWindow, Ui_MainWindow):
             E=self.pw_E,
         )
 
+        # Display settings read from the widgets, refreshed by `updateSettings` at the start of every redraw
         self.settings = dotmap.DotMap(dict(
-            resolution=dict(left=-1, bottom=-1, right=1, top=1)
+            resolution=dict(left=-1, bottom=-1, right=1, top=1),
+            error_limit=None,
+            error_limit_degrees=None,
+            arrow_scale=None,
+            grid_resolution=None,
+            bandwidth=None,
+            show_errors=None,
+            show_grid=None,
+            interpolation=None,
         ))
 
         self.calibration = LogCalibration(4000)
@@ -52,10 +65,8 @@ class MainWindowBase(QMainWindow, Ui_MainWindow):
         return isinstance(self.matcher, Counselor)
 
     def showErrors(self) -> None:
-        rms_error = self.matcher.rms_error(self.position_errors)
-        max_error = self.matcher.max_error(self.position_errors)
+        rms_error, max_error = self.matcher.rms_max_error(self.position_errors)
         self.lb_rms_error.setText(f'{np.degrees(rms_error):.6f}°')
         self.lb_max_error.setText(f'{np.degrees(max_error):.6f}°')
         self.lb_total_stars.setText(f'{self.matcher.catalogue.count}')
-        outside_limit = self.position_errors[self.position_errors > np.radians(self.dsb_error_limit.value())].size
-        self.lb_outside_limit.setText(f'{outside_limit}')
+        self.lb_outside_limit.setText(f'{np.count_nonzero(self.position_errors > self.settings.error_limit)}')
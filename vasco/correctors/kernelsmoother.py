@@ -11,13 +11,22 @@ class KernelSmoother(BaseCorrector):
         self.bandwidth = bandwidth
 
     def __call__(self, nodes):
-        # Calculate distance from every point to every node
-        distances = np.sqrt(np.sum((np.expand_dims(self.points, 1) - np.expand_dims(nodes, 0))**2, axis=2))
+        xy = np.ma.getdata(nodes)
+        # Calculate distance from every point to every node, shape (P, N)
+        distances = np.hypot(
+            np.subtract.outer(self.points[:, 0], xy[:, 0]),
+            np.subtract.outer(self.points[:, 1], xy[:, 1]),
+        )
         # Calculate influences as a kernel function of scaled distance
         infl = self.kernel(distances / self.bandwidth)
-        # Calculate the sum of weighted votes
-        votes = np.sum(np.expand_dims(infl, 2) * np.expand_dims(self.values, 1), axis=0)
+        # Calculate the sum of weighted votes as a matrix product, without a (P, N, D) temporary
+        votes = infl.T @ self.values
         # Calculate the overall sum of weights for normalization
         sums = np.expand_dims(np.sum(infl, axis=0), 1)
-        return votes / sums
 
+        if np.ma.isMaskedArray(nodes):
+            # Masked nodes and nodes without any influence produce masked results, like masked division would
+            mask = np.ma.getmaskarray(nodes).any(axis=1, keepdims=True) | (sums == 0)
+            return np.ma.masked_array(votes / np.where(mask, 1, sums), np.broadcast_to(mask, votes.shape))
+        else:
+            return votes / sums
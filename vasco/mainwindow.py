@@ -1,4 +1,6 @@
+import functools
 import logging
+import math
 
 import yaml
 import pytz
@@ -13,24 +15,37 @@ from PyQt6.QtCore import QDateTime, Qt
 from astropy import units as u
 from astropy.coordinates import EarthLocation
 from pathlib import Path
-import matplotlib as mpl
 
 from matchers import Matchmaker, Counselor
 from amosutils.projections import BorovickaProjection
 from plotting import MainWindowPlots
-from models import SensorData, QMeteorModel
+from models import SensorData
+from models.qmeteormodel import QMeteorModel
 from export import XMLExporter
+from utilities import load_yaml
 
 import colour as c
 from amos import AMOS, Station
 
-mpl.use('Qt5Agg')
-
 log = logging.getLogger('vasco')
 
 VERSION = "0.8.0"
 DATE = "2023-07-18"
 
+# Rapid series of parameter edits within this interval (ms) are coalesced into a single recomputation
+PARAMETER_DEBOUNCE = 50
+# Display setting changes only trigger a replot, so they are coalesced over roughly one frame (ms)
+REPLOT_DEBOUNCE = 16
+
+
+@functools.lru_cache(maxsize=32)
+def earth_location(latitude: float, longitude: float, altitude: float) -> EarthLocation:
+    """
+    Construct the EarthLocation only once for every position: identical positions then share
+    the same object, which in turn lets the catalogue reuse its cached AltAz transformation
+    """
+    return EarthLocation.from_geodetic(longitude * u.deg, latitude * u.deg, altitude * u.m)
+
 
 class MainWindow(MainWindowPlots):
     def __init__(self, args, parent=None):
@@ -38,6 +53,17 @@ class MainWindow(MainWindowPlots):
         self.populateStations()
         self.updateProjection()
 
+        self.parameterTimer = QtCore.QTimer(self)
+        self.parameterTimer.setSingleShot(True)
+        self.parameterTimer.setInterval(PARAMETER_DEBOUNCE)
+        self.parameterTimer.timeout.connect(self.onProjectionParametersChanged)
+
+        self.replotTimer = QtCore.QTimer(self)
+        self.replotTimer.setSingleShot(True)
+        self.replotTimer.setInterval(REPLOT_DEBOUNCE)
+        self.replotTimer.timeout.connect(self.updatePlots)
+
+        self.updateSettings()
         self.connectSignalSlots()
 
         self.updateLocation()
@@ -52,8 +78,8 @@ class MainWindow(MainWindowPlots):
             self._importProjectionParameters(args.projection.name)
 
         self.showCounts()
+        self.updateScaling()
         self.onProjectionParametersChanged()
-        self.onScalingChanged()
 
         self.tw_charts.setCurrentIndex(1)
 
@@ -69,17 +95,17 @@ class MainWindow(MainWindowPlots):
         self.ac_about.triggered.connect(self.displayAbout)
 
         for widget in self.param_widgets.values():
-            widget.dsb_value.valueChanged.connect(self.onProjectionParametersChanged)
+            widget.dsb_value.valueChanged.connect(self.scheduleProjectionParametersChanged)
 
         "The shape of the dot collection and the catalogue must be the same, got {obs.shape} and {cat.shape}"
         self.pw_x0.setup(title="H shift", symbol="x<sub>0</sub>", unit="mm", minimum=-5, maximum=5, step=0.001)
         self.pw_y0.setup(title="V shift", symbol="y<sub>0</sub>", unit="mm", minimum=-5, maximum=5, step=0.001)
         self.pw_a0.setup(title="rotation", symbol="a<sub>0</sub>", unit="°", minimum=0, maximum=359.999999, step=0.2,
-                         display_to_true=np.radians, true_to_display=np.degrees)
+                         display_to_true=math.radians, true_to_display=math.degrees)
 
         self.pw_A.setup(title="amplitude", symbol="A", unit="", minimum=-1, maximum=1, step=0.001)
         self.pw_F.setup(title="phase", symbol="F", unit="°", minimum=0, maximum=359.999999, step=1,
-                        display_to_true=np.radians, true_to_display=np.degrees)
+                        display_to_true=math.radians, true_to_display=math.degrees)
 
         self.pw_V.setup(title="linear", symbol="&V", unit="rad/mm", minimum=0.001, maximum=1, step=0.001)
         self.pw_S.setup(title="exp coef", symbol="&S", unit="rad/mm", minimum=-100, maximum=100, step=0.001)
@@ -88,9 +114,9 @@ class MainWindow(MainWindowPlots):
         self.pw_Q.setup(title="biexp exp", symbol="&Q", unit="mm<sup>-2</sup>", minimum=-100, maximum=100, step=0.0001)
 
         self.pw_epsilon.setup(title="zenith angle", symbol="ε", unit="°", minimum=0, maximum=90, step=0.1,
-                              display_to_true=np.radians, true_to_display=np.degrees)
+                              display_to_true=math.radians, true_to_display=math.degrees)
         self.pw_E.setup(title="azimuth", symbol="E", unit="°", minimum=0, maximum=359.999999, step=1,
-                        display_to_true=np.radians, true_to_display=np.degrees)
+                        display_to_true=math.radians, true_to_display=math.degrees)
 
         self.dt_time.dateTimeChanged.connect(self.updateTime)
         self.dt_time.dateTimeChanged.connect(self.onTimeChanged)
@@ -118,9 +144,9 @@ class MainWindow(MainWindowPlots):
         self.sb_arrow_scale.valueChanged.connect(self.onArrowScaleChanged)
         self.sb_resolution.valueChanged.connect(self.onResolutionChanged)
 
-        self.cb_show_errors.clicked.connect(self.plotPositionCorrectionErrors)
-        self.cb_show_grid.clicked.connect(self.plotPositionCorrectionGrid)
-        self.cb_interpolation.currentIndexChanged.connect(self.plotMagnitudeCorrectionGrid)
+        self.cb_show_errors.clicked.connect(self.onShowErrorsChanged)
+        self.cb_show_grid.clicked.connect(self.onShowGridChanged)
+        self.cb_interpolation.currentIndexChanged.connect(self.onInterpolationChanged)
 
         self.pb_export_xml.clicked.connect(self.ac_export_meteor.trigger)
 
@@ -159,11 +185,7 @@ class MainWindow(MainWindowPlots):
         self.dsb_alt.setValue(alt)
 
     def updateLocation(self):
-        self.location = EarthLocation(
-            self.dsb_lon.value() * u.deg,
-            self.dsb_lat.value() * u.deg,
-            self.dsb_alt.value() * u.m,
-        )
+        self.location = earth_location(self.dsb_lat.value(), self.dsb_lon.value(), self.dsb_alt.value())
 
     def setTime(self, time):
         self.dt_time.setDateTime(QDateTime(time.date(), time.time(), Qt.TimeSpec.UTC))
@@ -171,21 +193,38 @@ class MainWindow(MainWindowPlots):
     def updateTime(self):
         self.time = self.dt_time.dateTime().toPyDateTime()
 
-    def onScalingChanged(self):
+    def updateScaling(self):
         self.matcher.sensor_data.set_shifter_scales(
             self.dsb_xs.value(),
             self.dsb_ys.value()
         )
-        self.onProjectionParametersChanged()
+
+    def onScalingChanged(self):
+        self.updateScaling()
+        self.scheduleProjectionParametersChanged()
 
     def updateMatcher(self):
         self.matcher.update(self.location, self.time)
-        self.matcher.update_position_smoother(self.projection)
+        self.invalidateSmoothers()
 
     def updateProjection(self):
-        self.projection = BorovickaProjection(*self.getProjectionParameters())
+        parameters = self.getProjectionParameters()
+        # Do not rebuild the projection if no parameter has actually changed
+        if self.projection is None or not np.array_equal(parameters, self.projection_parameters):
+            self.projection = BorovickaProjection(*parameters)
+            self.projection_parameters = parameters
+
+    def scheduleProjectionParametersChanged(self):
+        """ (Re)start the debounce timer, the recomputation is only run once the edits stop """
+        self.parameterTimer.start()
+
+    def flushProjectionParameters(self):
+        """ Apply parameter edits still waiting for the debounce timer, before an action that uses the projection """
+        if self.parameterTimer.isActive():
+            self.onProjectionParametersChanged()
 
     def onProjectionParametersChanged(self):
+        self.parameterTimer.stop()
         log.info(f"Parameters changed: {self.getProjectionParameters()}")
         self.updateProjection()
 
@@ -197,10 +236,10 @@ class MainWindow(MainWindowPlots):
         self.magnitudeErrorPlot.invalidate()
         self.positionCorrectionPlot.invalidate()
         self.magnitudeCorrectionPlot.invalidate()
-        self.matcher.update_position_smoother(self.projection, bandwidth=self.bandwidth())
+        self.invalidateSmoothers()
 
         self.computePositionErrors()
-        self.computeMagnitudeErrors()
+        self.invalidateMagnitudeErrors()
         self.updatePlots()
 
     def onLocationTimeChanged(self):
@@ -212,21 +251,46 @@ class MainWindow(MainWindowPlots):
         self.positionErrorPlot.invalidate()
         self.magnitudeErrorPlot.invalidate()
 
-        bandwidth = self.bandwidth()
-        self.matcher.update_position_smoother(self.projection, bandwidth=bandwidth)
-        self.matcher.update_magnitude_smoother(self.projection, self.calibration, bandwidth=bandwidth)
+        self.invalidateSmoothers()
         self.positionCorrectionPlot.invalidate()
         self.magnitudeCorrectionPlot.invalidate()
 
         self.computePositionErrors()
-        self.computeMagnitudeErrors()
+        self.invalidateMagnitudeErrors()
         self.updatePlots()
 
+    def updateSettings(self):
+        """ Read the display settings from the widgets once, so that plotting methods do not have to query them """
+        self.settings.error_limit_degrees = self.dsb_error_limit.value()
+        self.settings.error_limit = math.radians(self.settings.error_limit_degrees)
+        self.settings.arrow_scale = self.sb_arrow_scale.value()
+        self.settings.grid_resolution = self.sb_resolution.value()
+        self.settings.bandwidth = self.bandwidth()
+        self.settings.show_errors = self.cb_show_errors.isChecked()
+        self.settings.show_grid = self.cb_show_grid.isChecked()
+        self.settings.interpolation = self.cb_interpolation.currentText()
+
+    def scheduleUpdatePlots(self):
+        """ (Re)start the replot timer, so that a burst of setting changes results in a single replot """
+        self.replotTimer.start()
+
     def onErrorLimitChanged(self):
         self.positionSkyPlot.invalidate_dots()
         self.positionErrorPlot.invalidate()
         self.positionCorrectionPlot.invalidate_dots()
-        self.updatePlots()
+        self.scheduleUpdatePlots()
+
+    def onShowErrorsChanged(self):
+        self.updateSettings()
+        self.plotPositionCorrectionErrors()
+
+    def onShowGridChanged(self):
+        self.updateSettings()
+        self.plotPositionCorrectionGrid()
+
+    def onInterpolationChanged(self):
+        self.updateSettings()
+        self.plotMagnitudeCorrectionGrid()
 
     def onBandwidthSettingChanged(self):
         bandwidth = self.bandwidth()
@@ -236,9 +300,7 @@ class MainWindow(MainWindowPlots):
         if action == 7:  # do not do anything if the user did not drop the slider yet
             return
 
-        bandwidth = self.bandwidth()
-        self.matcher.update_position_smoother(self.projection, bandwidth=bandwidth)
-        self.matcher.update_magnitude_smoother(self.projection, self.calibration, bandwidth=bandwidth)
+        self.invalidateSmoothers()
         self.positionCorrectionPlot.invalidate_grid()
         self.positionCorrectionPlot.invalidate_meteor()
         self.magnitudeCorrectionPlot.invalidate_grid()
@@ -248,12 +310,12 @@ class MainWindow(MainWindowPlots):
     def onArrowScaleChanged(self):
         self.positionCorrectionPlot.invalidate_dots()
         self.positionCorrectionPlot.invalidate_meteor()
-        self.updatePlots()
+        self.scheduleUpdatePlots()
 
     def onResolutionChanged(self):
         self.positionCorrectionPlot.invalidate_grid()
         self.magnitudeCorrectionPlot.invalidate_grid()
-        self.updatePlots()
+        self.scheduleUpdatePlots()
 
     def bandwidth(self):
         return 10**(-self.hs_bandwidth.value() / 100)
@@ -264,8 +326,28 @@ class MainWindow(MainWindowPlots):
     def computePositionErrors(self):
         self.position_errors = self.matcher.position_errors(self.projection, masked=True)
 
+    def invalidateMagnitudeErrors(self):
+        self.valid_magnitude_errors = False
+
     def computeMagnitudeErrors(self):
-        self.magnitude_errors = self.matcher.magnitude_errors(self.projection, self.calibration, masked=True)
+        """ Magnitude errors are only shown on some tabs, so they are recomputed lazily when invalidated """
+        if not self.valid_magnitude_errors:
+            self.magnitude_errors = self.matcher.magnitude_errors(self.projection, self.calibration, masked=True)
+            self.valid_magnitude_errors = True
+
+    def invalidateSmoothers(self):
+        self.valid_position_smoother = False
+        self.valid_magnitude_smoother = False
+
+    def updateSmoothers(self):
+        """ Rebuild the smoothers that were invalidated since the last update, each at most once """
+        if not self.valid_position_smoother:
+            self.matcher.update_position_smoother(self.projection, bandwidth=self.settings.bandwidth)
+            self.valid_position_smoother = True
+        if not self.valid_magnitude_smoother:
+            self.matcher.update_magnitude_smoother(self.projection, self.calibration,
+                                                   bandwidth=self.settings.bandwidth)
+            self.valid_magnitude_smoother = True
 
     def loadCatalogue(self):
         filename, _ = QFileDialog.getOpenFileName(self, "Load catalogue file", "catalogues",
@@ -325,7 +407,8 @@ class MainWindow(MainWindowPlots):
         self.updatePlots()
 
     def _loadSighting(self, file):
-        data = dotmap.DotMap(yaml.safe_load(open(file, 'r')), _dynamic=False)
+        with open(file, 'r') as f:
+            data = dotmap.DotMap(load_yaml(f), _dynamic=False)
         self.setLocation(data.Latitude, data.Longitude, data.Altitude)
         self.updateLocation()
         self.setTime(pytz.UTC.localize(datetime.datetime.strptime(data.EventStartTime, "%Y-%m-%d %H:%M:%S.%f")))
@@ -347,7 +430,7 @@ class MainWindow(MainWindowPlots):
             self._blockParameterSignals(True)
             with open(filename, 'r') as file:
                 try:
-                    data = dotmap.DotMap(yaml.safe_load(file), _dynamic=False)
+                    data = dotmap.DotMap(load_yaml(file), _dynamic=False)
                     for param, widget in self.param_widgets.items():
                         widget.set_display_value(widget.true_to_display(data.projection.parameters[param]))
                         self.dsb_xs.setValue(data.pixels.xs)
@@ -400,17 +483,21 @@ class MainWindow(MainWindowPlots):
             self.tabs_table.setCurrentIndex(0)
 
     def maskSensor(self):
+        self.flushProjectionParameters()
         if self.paired:
             self.pair()
 
+        # The snapshot may lag behind the spin box while a replot is still pending
+        self.updateSettings()
         errors = self.matcher.position_errors(self.projection, masked=False)
-        self.matcher.mask_sensor_data(errors < np.radians(self.dsb_error_limit.value()))
-        log.info(f"Culled the dots to {c.param(f'{self.dsb_error_limit.value():.3f}')}°: "
+        self.matcher.mask_sensor_data(errors < self.settings.error_limit)
+        log.info(f"Culled the dots to {c.param(f'{self.settings.error_limit_degrees:.3f}')}°: "
                  f"{c.num(self.matcher.sensor_data.stars.count_valid)} are valid")
         self.onProjectionParametersChanged()
         self.showCounts()
 
     def maskCatalogueDistant(self):
+        self.flushProjectionParameters()
         if self.paired:
             self.pair()
 
@@ -421,9 +508,10 @@ class MainWindow(MainWindowPlots):
 
         self.positionSkyPlot.invalidate_stars()
         self.magnitudeSkyPlot.invalidate_stars()
+        self.invalidateSmoothers()
 
         self.computePositionErrors()
-        self.computeMagnitudeErrors()
+        self.invalidateMagnitudeErrors()
         self.updatePlots()
         self.showCounts()
 
@@ -437,9 +525,10 @@ class MainWindow(MainWindowPlots):
 
         self.positionSkyPlot.invalidate_stars()
         self.magnitudeSkyPlot.invalidate_stars()
+        self.invalidateSmoothers()
 
         self.computePositionErrors()
-        self.computeMagnitudeErrors()
+        self.invalidateMagnitudeErrors()
         self.updatePlots()
         self.showCounts()
 
@@ -463,6 +552,7 @@ class MainWindow(MainWindowPlots):
         self.lb_objects_near.setText(f'{self.matcher.sensor_data.stars.count_valid}')
 
     def exportCorrectedMeteor(self):
+        self.flushProjectionParameters()
         if not self.paired:
             log.warning("Cannot export a meteor before pairing dots to the catalogue")
             return None
@@ -470,15 +560,17 @@ class MainWindow(MainWindowPlots):
         filename, _ = QFileDialog.getSaveFileName(self, "Export corrected meteor to file", "output/",
                                                   "XML files (*.xml)")
         if filename is not None and filename != '':
+            self.updateSmoothers()
             exporter = XMLExporter(self.matcher, self.location, self.time, self.projection, self.calibration)
             exporter.export(filename)
 
     @property
     def grid_resolution(self):
-        return self.sb_resolution.value()
+        return self.settings.grid_resolution
 
     def pair(self):
-        if (rms_error := np.degrees(self.matcher.rms_error(self.position_errors))) > 0.3:
+        self.flushProjectionParameters()
+        if (rms_error := math.degrees(self.matcher.rms_error(self.position_errors))) > 0.3:
             reply = QMessageBox.warning(self, "Mean position error limit exceeded!",
                                         f"Mean position error is currently {rms_error:.6f}°.\n"
                                         f"Are you sure your approximate solution is correct?",
@@ -487,8 +579,8 @@ class MainWindow(MainWindowPlots):
                 return False
 
         self.matcher = self.matcher.pair(self.projection)
-        self.matcher.update_position_smoother(self.projection, bandwidth=self.bandwidth())
-        self.matcher.update_magnitude_smoother(self.projection, self.calibration, bandwidth=self.bandwidth())
+        self.invalidateSmoothers()
+        self.invalidateMagnitudeErrors()
 
         self.positionSkyPlot.invalidate_dots()
         self.positionSkyPlot.invalidate_stars()
@@ -1,5 +1,6 @@
 import logging
 import math
+import time
 import dotmap
 import numpy as np
 import scipy as sp
@@ -19,6 +20,11 @@ class Matcher(metaclass=ABCMeta):
     The base class for matching sensor data to the catalogue.
     """
 
+    # Method name passed to the solver in `_optimize`: here a scipy.optimize.minimize method, since nearest-star
+    # distances are only piecewise smooth and the starting point is usually close, so default to the small local
+    # simplex of Nelder-Mead. Subclasses that override `_optimize` reinterpret it for their own solver.
+    optimization_method: str = 'Nelder-Mead'
+
     def __init__(self, location, time, projection_cls=BorovickaProjection, *,
                  catalogue: Optional[Catalogue] = None,
                  sensor_data: Optional[SensorData] = None):
@@ -84,12 +90,19 @@ class Matcher(metaclass=ABCMeta):
         if errors.size == 0:
             return np.nan
         else:
-            return np.sqrt(np.sum(np.square(errors)) / errors.size)
+            errors = np.ravel(errors)
+            # dot product accumulates the squares without materializing a temporary array
+            return math.sqrt(np.dot(errors, errors) / errors.size)
 
     @staticmethod
     def max_error(errors: np.ndarray[float]) -> float:
         return np.max(errors, initial=0)
 
+    @classmethod
+    def rms_max_error(cls, errors: np.ndarray[float]) -> tuple[float, float]:
+        """ Return both the RMS and the maximum error, for display purposes. These are two passes over `errors`. """
+        return cls.rms_error(errors), cls.max_error(errors)
+
     @abstractmethod
     def correct_meteor(self, projection: Projection, calibration: Calibration) -> dotmap.DotMap:
         pass
@@ -101,30 +114,47 @@ class Matcher(metaclass=ABCMeta):
     def func(self, x):
         return self.rms_error(self.position_errors(self.projection_cls(*x), masked=True))
 
-    @staticmethod
-    def _get_optimization_parameters(x0, mask):
-        return x0[~mask]
-
     def _build_optimization_function(self,
-                                     mask: np.ndarray[float]) -> Callable[[np.ndarray[float], ...], float]:
+                                     x0: np.ndarray[float],
+                                     mask: np.ndarray[bool]) -> Callable[[np.ndarray[float]], float]:
         """
         Split the parameter vector into immutable and variable part depending on mask
         and return a loss function in which only variable parameters are to be optimized
-        and immutable ones are treated as constants
+        and immutable ones are treated as constants.
+        The full parameter vector is allocated once, with immutable parameters already in place,
+        so that every evaluation only has to overwrite the variable ones.
         """
-        ifixed = np.where(~mask)
-        ivariable = np.where(mask)
+        vec = np.array(x0, dtype=float)
 
-        def func(x: np.ndarray[float], *args) -> float:
-            variable = np.array(x)
+        def func(x: np.ndarray[float]) -> float:
+            vec[mask] = x
+            try:
+                projection = self.projection_cls(*vec)
+            except (AssertionError, ValueError):
+                # The projection rejects parameters outside of its domain: treat them as infinitely bad
+                return np.inf
+            return self.rms_error(self.position_errors(projection, masked=True))
 
-            vec = np.zeros(shape=(12,))
-            np.put(vec, ivariable, variable)
-            np.put(vec, ifixed, np.array(args))
+        return func
 
-            return self.rms_error(self.position_errors(self.projection_cls(*vec), masked=True))
+    @staticmethod
+    def _build_progress_callback(interval: float = 0.1) -> Callable[[np.ndarray], None]:
+        """
+        Build an optimizer callback that logs the current parameters at most once per `interval` seconds
+        """
+        last = 0.0
 
-        return func
+        def callback(x: np.ndarray[float]) -> None:
+            nonlocal last
+            if not log.isEnabledFor(logging.DEBUG):
+                return
+
+            now = time.monotonic()
+            if now - last >= interval:
+                log.debug(np.array2string(x, precision=4))
+                last = now
+
+        return callback
 
     def get_optimization_bounds(self, mask):
         return self.projection_cls.bounds[mask]
@@ -135,27 +165,45 @@ class Matcher(metaclass=ABCMeta):
                  *,
                  mask=np.ones(shape=(12,), dtype=bool)):
 
-        self._altaz = self.catalogue.to_altaz(self.location, self.time, masked=True)
-        func = self._build_optimization_function(mask)
-        args = self._get_optimization_parameters(np.array(x0), mask)
+        x0 = np.array(x0, dtype=float)
 
         if np.count_nonzero(mask) == 0:
             log.warning("At least one parameter must be allowed to vary")
             return tuple(x0)
 
+        # Location, time and masks are fixed while optimizing, so hold the masked AltAz catalogue
+        # for this run only and skip even the cache lookup in every evaluation
+        self._altaz = self.catalogue.to_altaz(self.location, self.time, masked=True)
+        try:
+            # Restore the full parameter vector from immutable original values and variable optimized ones
+            vec = x0.copy()
+            vec[mask] = self._optimize(x0, mask, maxiter=maxiter)
+        finally:
+            self._altaz = None
+
+        return tuple(vec)
+
+    def _optimize(self, x0: np.ndarray[float], mask: np.ndarray[bool], *, maxiter: int) -> np.ndarray[float]:
+        """
+        Run the optimizer over the variable parameters and return their optimized values.
+        If the optimizer did not improve on the starting point, the starting values are returned instead.
+        """
+        func = self._build_optimization_function(x0, mask)
+        initial = func(x0[mask])
         result = sp.optimize.minimize(
             func,
             x0[mask],
-            args,
-            method='Nelder-Mead',
+            method=self.optimization_method,
             bounds=self.get_optimization_bounds(mask),
-            options=dict(maxiter=maxiter, disp=True),
-            callback=lambda x: log.debug(x),
+            options=dict(maxiter=maxiter),
+            callback=self._build_progress_callback(),
         )
+        log.info(f"Optimization ({self.optimization_method}) finished after {result.nit} iterations "
+                 f"and {result.nfev} evaluations: {result.message}")
 
-        # Restore the full parameter vector from immutable original args and variable optimized args
-        vec = np.zeros(shape=(12,))
-        np.put(vec, np.where(mask), result.x)
-        np.put(vec, np.where(~mask), args)
-
-        return tuple(vec)
+        if not result.fun < initial:
+            log.warning(f"Optimization did not improve the loss ({initial:.6f} to {result.fun:.6f}), "
+                        f"keeping the initial parameters")
+            return x0[mask]
+        else:
+            return result.x
@@ -3,10 +3,12 @@ import math
 
 import dotmap
 import numpy as np
+import scipy as sp
 
 from .base import Matcher
 
 from astropy.coordinates import AltAz
+from typing import Callable
 
 from models import Catalogue, SensorData
 from amosutils.projections import Projection
@@ -25,6 +27,10 @@ class Counselor(Matcher):
     with the catalogue *after* the stars were paired to sensor dots.
     """
 
+    # With fixed pairs every pair contributes one smooth residual, so the fit is a bounded least-squares problem
+    # and `optimization_method` names the scipy.optimize.least_squares method instead
+    optimization_method: str = 'trf'
+
     def __init__(self, location, time, projection_cls, *,
                  catalogue: Catalogue,
                  sensor_data: SensorData):
@@ -82,13 +88,75 @@ class Counselor(Matcher):
     def position_errors(self, projection: Projection, *, masked: bool):
         sensor = self.sensor_data.stars.project(projection, masked=masked)
         altaz = self._altaz \
-            if self._altaz is not None and self._altaz.shape == sensor.shape \
+            if masked and self._altaz is not None \
             else self.catalogue.to_altaz(self.location, self.time, masked=masked)
         assert sensor.shape == altaz.shape, \
             f"The shape of the dot collection and the catalogue must be the same, got {sensor.shape} and {altaz.shape}"
 
         return self.compute_distances(sensor, altaz)
 
+    def _build_residual_function(self,
+                                 x0: np.ndarray[float],
+                                 mask: np.ndarray[bool]) -> Callable[[np.ndarray[float]], np.ndarray[float]]:
+        """ Like `_build_optimization_function`, but return the individual distances of unmasked pairs """
+        vec = np.array(x0, dtype=float)
+        count = self.catalogue.count_valid
+
+        def func(x: np.ndarray[float]) -> np.ndarray[float]:
+            vec[mask] = x
+            try:
+                projection = self.projection_cls(*vec)
+            except (AssertionError, ValueError):
+                # The projection rejects parameters outside of its domain: every pair is off by half a turn.
+                # The residuals must stay finite, least_squares cannot step away from infinities.
+                return np.full(count, math.pi)
+            return np.ma.compressed(self.position_errors(projection, masked=True))
+
+        return func
+
+    def get_optimization_bounds(self, mask):
+        """
+        Like the projection bounds, but numeric as least_squares requires: unbounded parameters get infinities
+        and A, which the Borovička projection only accepts within [-1, 1], is limited to that interval
+        """
+        bounds = self.projection_cls.bounds.astype(float)
+        bounds[:, 0] = np.nan_to_num(bounds[:, 0], nan=-np.inf)
+        bounds[:, 1] = np.nan_to_num(bounds[:, 1], nan=np.inf)
+        bounds[3] = (-1, 1)
+        return bounds[mask]
+
+    def _optimize(self, x0: np.ndarray[float], mask: np.ndarray[bool], *, maxiter: int) -> np.ndarray[float]:
+        """
+        Minimize the sum of squared distances directly with a trust region reflective least-squares solver.
+        It sees every residual instead of just their RMS, so it needs far fewer evaluations than a general minimizer.
+        The Jacobian is estimated by finite differences, as the projection does not provide analytic derivatives.
+        If the solver did not improve on the starting point, the starting values are returned instead.
+        """
+        bounds = self.get_optimization_bounds(mask)
+        lower, upper = bounds[:, 0], bounds[:, 1]
+        func = self._build_residual_function(x0, mask)
+        start = np.clip(x0[mask], lower, upper)
+        initial = 0.5 * np.sum(np.square(func(start)))
+
+        result = sp.optimize.least_squares(
+            func,
+            start,
+            method=self.optimization_method,
+            bounds=(lower, upper),
+            x_scale='jac',
+            ftol=1e-4,          # relative change of the cost, i.e. about 5e-5 of the RMS: far below the star scatter
+            max_nfev=maxiter,
+        )
+        log.info(f"Optimization ({self.optimization_method}) finished after {result.nfev} evaluations "
+                 f"and {result.njev} Jacobian estimates: {result.message}")
+
+        # Stopped at `max_nfev` the solver may end up worse than where it started, never return such a fit
+        if not result.cost < initial:
+            log.warning(f"Optimization did not improve the cost ({initial:.6f} to {result.cost:.6f}), "
+                        f"keeping the initial parameters")
+            return x0[mask]
+        return result.x
+
     def magnitude_errors(self, projection: Projection, calibration: Calibration, *, masked: bool):
         obs = calibration(self.sensor_data.stars.intensities(masked=masked))
         cat = self.catalogue.vmag(masked=masked)
@@ -48,9 +48,8 @@ class Matchmaker(Matcher):
         """
         return func(
             self.sensor_data.stars.project(projection, masked=masked),
-            self._altaz if self._altaz is not None else self.catalogue.to_altaz(self.location,
-                                                                                self.time,
-                                                                                masked=masked),
+            self._altaz if masked and self._altaz is not None
+            else self.catalogue.to_altaz(self.location, self.time, masked=masked),
             axis=axis,
         )
 
@@ -1,4 +1,2 @@
 from .sensordata import SensorData
 from .catalogue import Catalogue
-
-from .qmeteormodel import QMeteorModel
\ No newline at end of file
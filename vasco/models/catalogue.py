@@ -19,6 +19,10 @@ class Catalogue:
         self.stars: pd.DataFrame = pd.DataFrame()
         self.skycoord: Optional[SkyCoord] = None
         self.name: str = name
+        # Cached transformation of the whole catalogue to AltAz, valid for a single location and time
+        self._altaz: Optional[SkyCoord] = None
+        self._altaz_location = None
+        self._altaz_time = None
 
         if stars is None:
             self.stars = pd.DataFrame(dict(
@@ -47,6 +51,7 @@ class Catalogue:
             self.stars.dec.to_numpy() * u.deg,
             frame=FK5(equinox=Time('J2000')),
         )
+        self._altaz = None
 
     def filter_by_vmag(self, vmag):
         self.stars[self.stars.vmag <= vmag]['use'] = False
@@ -89,9 +94,17 @@ class Catalogue:
         return self.stars[self.mask]
 
     def altaz(self, location, time, *, masked: bool):
-        altaz = AltAz(location=location, obstime=time, pressure=100000 * u.pascal, obswl=550 * u.nm)
-        altaz = self.skycoord.transform_to(altaz)
-        return altaz[self.mask] if masked else altaz
+        """
+        Transform the catalogue to horizontal coordinates. The transformation does not depend on the mask,
+        so it is computed for the whole catalogue and reused until the location, time or coordinates change.
+        """
+        if self._altaz is None or location is not self._altaz_location or time != self._altaz_time:
+            frame = AltAz(location=location, obstime=time, pressure=100000 * u.pascal, obswl=550 * u.nm)
+            self._altaz = self.skycoord.transform_to(frame)
+            self._altaz_location = location
+            self._altaz_time = time
+
+        return self._altaz[self.mask] if masked else self._altaz
 
     def to_altaz(self, location, time, *, masked: bool = True):
         """ Returns a packed (N, 2) np.ndarray with altitude and azimuth in radians """
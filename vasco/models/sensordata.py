@@ -2,7 +2,6 @@ import copy
 import datetime
 import numpy as np
 import dotmap
-import yaml
 
 import colour as c
 
@@ -13,6 +12,7 @@ import astropy.units as u
 from .dotcollection import DotCollection
 from amosutils.projections.shifters import ScalingShifter
 from .rect import Rect
+from utilities import load_yaml
 
 
 class SensorData:
@@ -41,7 +41,8 @@ class SensorData:
 
     @staticmethod
     def load_YAML(file):
-        data = dotmap.DotMap(yaml.safe_load(open(file, 'r')), _dynamic=False)
+        with open(file, 'r') as f:
+            data = dotmap.DotMap(load_yaml(f), _dynamic=False)
 
         w, h = tuple(map(int, data.Resolution.split('x')))
         stars = DotCollection(
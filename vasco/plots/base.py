@@ -1,6 +1,6 @@
 from abc import abstractmethod
 
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
 from matplotlib.figure import Figure
 
 
@@ -24,7 +24,9 @@ class BasePlot:
         """ Add axes to this plot """
 
     def draw(self):
-        self.canvas.draw()
+        # Schedule a repaint instead of rendering immediately: consecutive updates
+        # of several artists on the same plot are then rendered only once
+        self.canvas.draw_idle()
 
     @abstractmethod
     def invalidate(self):
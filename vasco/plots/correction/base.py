@@ -8,9 +8,9 @@ from utilities import altaz_to_disk, proj_to_disk
 
 
 class BaseCorrectionPlot(BasePlot):
-    cmap_dots = mpl.pyplot.get_cmap('autumn_r')
-    cmap_grid = mpl.pyplot.get_cmap('Greens')
-    cmap_meteor = mpl.pyplot.get_cmap('RdYlGn')
+    cmap_dots = mpl.colormaps['autumn_r']
+    cmap_grid = mpl.colormaps['Greens']
+    cmap_meteor = mpl.colormaps['RdYlGn']
     colour_dots = 'white'
     colour_meteor = 'cyan'
 
@@ -5,8 +5,8 @@ from .base import BaseCorrectionPlot
 
 
 class MagnitudeCorrectionPlot(BaseCorrectionPlot):
-    cmap_dots = mpl.pyplot.get_cmap('bwr')
-    cmap_grid = mpl.pyplot.get_cmap('bwr')
+    cmap_dots = mpl.colormaps['bwr']
+    cmap_grid = mpl.colormaps['bwr']
     norm_grid = mpl.colors.TwoSlopeNorm(0, vmin=-2, vmax=2)
     target = "star magnitudes"
 
@@ -28,13 +28,19 @@ class MagnitudeCorrectionPlot(BaseCorrectionPlot):
         self._update_scatter(self.scatter_meteor, pos_obs, mag_obs, mag_obs - mag_corr, cmap=self.cmap_meteor)
 
     def _update_grid(self, x, y, grid, *, limit: float = 1, **kwargs):
-        if self.magnitude_grid is not None:
-            self.magnitude_grid.remove()
-
         xres, yres, zres = grid.shape
         assert xres == yres, f"Magnitude grid shape is not square, is ({xres}, {yres}, {zres})"
         assert zres == 1, f"Magnitude grid shape should be (R, R, 1), is ({xres}, {yres}, {zres})"
 
+        # The extent depends only on the resolution, so an image of the same shape can be reused as is
+        if self.magnitude_grid is not None:
+            if self.magnitude_grid.get_array().shape == grid.shape[:2]:
+                self.magnitude_grid.set_data(grid[..., 0])
+                self.magnitude_grid.set_interpolation(kwargs.get('interpolation', 'nearest'))
+                return
+            else:
+                self.magnitude_grid.remove()
+
         xext = (xres + 1) / xres
         yext = (yres + 1) / yres
         self.magnitude_grid = self.axis.imshow(
@@ -13,15 +13,33 @@ class PositionCorrectionPlot(BaseCorrectionPlot):
         self.quiver_grid = None
         self.quiver_meteor = None
 
+    def _update_quiver(self, quiver, x, y, u, v, c, **kwargs):
+        """
+        Update an existing quiver in place if the number of arrows has not changed, otherwise replace it.
+        Reusing the artist avoids rebuilding the collection and re-registering it with the axes on every redraw.
+        """
+        x, y = np.ravel(x), np.ravel(y)
+        if quiver is not None and quiver.N == x.size:
+            xy = np.column_stack((x, y))
+            quiver.XY = xy
+            quiver.set_offsets(xy)
+            quiver.scale = kwargs.get('scale')      # None makes matplotlib autoscale the arrows again
+            quiver.set_UVC(u, v, c)
+            quiver.autoscale()                      # and rescale the colour norm to the new values
+            return quiver
+
+        if quiver is not None:
+            quiver.remove()
+
+        return self.axis.quiver(x, y, u, v, c, **kwargs)
+
     def _update_dots(self, pos_obs, pos_cat, mag_obs, mag_cat, *, limit, scale):
         self.scatter_dots.set_offsets(pos_cat)
         self.scatter_dots.set_sizes(np.ones_like(pos_cat[:, 0]) * 4)
 
-        if self.quiver_dots is not None:
-            self.quiver_dots.remove()
-
         norm = mpl.colors.Normalize(vmin=0, vmax=limit)
-        self.quiver_dots = self.axis.quiver(
+        self.quiver_dots = self._update_quiver(
+            self.quiver_dots,
             pos_obs[:, 0], pos_obs[:, 1],
             pos_cat[:, 0] - pos_obs[:, 0], pos_cat[:, 1] - pos_obs[:, 1],
             norm(np.sqrt((pos_cat[:, 0] - pos_obs[:, 0]) ** 2 + (pos_cat[:, 1] - pos_obs[:, 1]) ** 2)),
@@ -33,10 +51,8 @@ class PositionCorrectionPlot(BaseCorrectionPlot):
         self.scatter_meteor.set_offsets(pos_obs)
         self.scatter_meteor.set_sizes(np.ones_like(pos_cat[:, 0]))
 
-        if self.quiver_meteor is not None:
-            self.quiver_meteor.remove()
-
-        self.quiver_meteor = self.axis.quiver(
+        self.quiver_meteor = self._update_quiver(
+            self.quiver_meteor,
             pos_obs[:, 0], pos_obs[:, 1],
             pos_cat[:, 0], pos_cat[:, 1],
             mag_obs,
@@ -46,12 +62,10 @@ class PositionCorrectionPlot(BaseCorrectionPlot):
         )
 
     def _update_grid(self, x, y, grid, *, limit: float = 1, **kwargs):
-        if self.quiver_grid is not None:
-            self.quiver_grid.remove()
-
         u, v = grid[..., 0].ravel(), grid[..., 1].ravel()
-        self.quiver_grid = self.axis.quiver(
-            x, y, u, v, np.sqrt(u**2 + v**2),
+        self.quiver_grid = self._update_quiver(
+            self.quiver_grid,
+            x, y, u, v, np.hypot(u, v),
             cmap=self.cmap_grid,
             width=0.0014,
         )
@@ -1,7 +1,6 @@
 import math
 import numpy as np
 import matplotlib as mpl
-from matplotlib import pyplot as plt
 
 from abc import abstractmethod
 
@@ -9,8 +8,8 @@ from plots.base import BasePlot
 
 
 class BaseSkyPlot(BasePlot):
-    cmap_stars = plt.get_cmap('autumn_r')
-    cmap_meteors = plt.get_cmap('Blues_r')
+    cmap_stars = mpl.colormaps['autumn_r']
+    cmap_meteors = mpl.colormaps['Blues_r']
     colour_stars = 'white'
     colour_dots = 'red'
     colour_meteor = 'cyan'
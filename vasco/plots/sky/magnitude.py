@@ -5,8 +5,8 @@ from plots.sky.base import BaseSkyPlot
 
 class MagnitudeSkyPlot(BaseSkyPlot):
     colour_stars = 'gray'
-    cmap_stars = mpl.pyplot.get_cmap('coolwarm')
-    cmap_meteors = mpl.pyplot.get_cmap('Blues_r')
+    cmap_stars = mpl.colormaps['coolwarm']
+    cmap_meteors = mpl.colormaps['Blues_r']
 
     def norm(self, limit):
         return mpl.colors.TwoSlopeNorm(0, vmin=-2, vmax=2)
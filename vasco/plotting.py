@@ -30,6 +30,9 @@ class MainWindowPlots(MainWindowBase):
         self.magnitudeCorrectionPlot = MagnitudeCorrectionPlot(self.tab_correction_magnitudes_enabled)
 
     def updatePlots(self):
+        self.updateSettings()
+        # Smoothers are needed by the meteor table whenever the data are paired, so rebuild them here
+        self.updateSmoothers()
         self.showErrors()
         links = [
             [
@@ -92,12 +95,13 @@ class MainWindowPlots(MainWindowBase):
     def plotObservedStarsPositions(self):
         log.debug(f"Plotting dot positions")
         self._plotObservedStars(self.positionSkyPlot, self.position_errors,
-                                limit=np.radians(self.dsb_error_limit.value()))
+                                limit=self.settings.error_limit)
 
     def plotObservedStarsMagnitudes(self):
         log.debug(f"Plotting dot magnitudes")
+        self.computeMagnitudeErrors()
         self._plotObservedStars(self.magnitudeSkyPlot, self.magnitude_errors,
-                                limit=np.radians(self.dsb_error_limit.value()))
+                                limit=self.settings.error_limit)
 
     def _plotCatalogueStars(self, plot):
         plot.update_stars(
@@ -118,7 +122,7 @@ class MainWindowPlots(MainWindowBase):
     def _plotErrorsDots(self, plot, errors):
         positions = self.matcher.sensor_data.stars.project(self.projection, masked=True)
         magnitudes = self.matcher.sensor_data.stars.intensities(True)
-        plot.update_dots(positions, magnitudes, errors, limit=self.dsb_error_limit.value())
+        plot.update_dots(positions, magnitudes, errors, limit=self.settings.error_limit_degrees)
 
     def plotPositionErrorsDots(self):
         log.debug(f"Plotting position errors")
@@ -126,6 +130,7 @@ class MainWindowPlots(MainWindowBase):
 
     def plotMagnitudeErrorsDots(self):
         log.debug(f"Plotting magnitude errors")
+        self.computeMagnitudeErrors()
         self._plotErrorsDots(self.magnitudeErrorPlot, self.magnitude_errors)
 
     def _plotErrorsMeteor(self, plot, errors):
@@ -156,15 +161,15 @@ class MainWindowPlots(MainWindowBase):
             tabs.setCurrentIndex(0)
 
     def _plotCorrectionErrors(self, plot: BaseCorrectionPlot) -> None:
-        if self.cb_show_errors.isChecked():
+        if self.settings.show_errors:
             log.debug(f"Plotting {plot.intent} for {plot.target}")
             plot.update_dots(
                 self.matcher.catalogue.altaz(self.location, self.time, masked=True),
                 self.matcher.sensor_data.stars.project(self.projection, masked=True),
                 self.matcher.catalogue.vmag(masked=True),
                 self.matcher.sensor_data.stars.calibrate(self.calibration, masked=True),
-                limit=np.radians(self.dsb_error_limit.value()),
-                scale=1 / self.sb_arrow_scale.value(),
+                limit=self.settings.error_limit,
+                scale=1 / self.settings.arrow_scale,
             )
         else:
             plot.clear_errors()
@@ -181,7 +186,7 @@ class MainWindowPlots(MainWindowBase):
             self.matcher.correction_meteor_xy(self.projection),
             self.matcher.sensor_data.meteor.calibrate(self.calibration, masked=True),
             self.matcher.correction_meteor_mag(self.projection),
-            scale=1 / self.sb_arrow_scale.value(),
+            scale=1 / self.settings.arrow_scale,
         )
 
     def plotPositionCorrectionMeteor(self) -> None:
@@ -191,7 +196,7 @@ class MainWindowPlots(MainWindowBase):
         self._switch_tabs(self.tabs_magnitudes, self._plotCorrectionMeteor, self.magnitudeCorrectionPlot)
 
     def _plotCorrectionGrid(self, plot, grid, *, masked: bool, **kwargs):
-        if self.cb_show_grid.isChecked():
+        if self.settings.show_grid:
             xx, yy = unit_grid(self.grid_resolution, masked=masked)
             plot.update_grid(xx, yy, grid(resolution=self.grid_resolution), **kwargs)
         else:
@@ -208,6 +213,6 @@ class MainWindowPlots(MainWindowBase):
         self._switch_tabs(
             self.tabs_magnitudes,
             lambda plot: self._plotCorrectionGrid(plot, self.matcher.magnitude_grid, masked=False,
-                                                  interpolation=self.cb_interpolation.currentText()),
+                                                  interpolation=self.settings.interpolation),
             self.magnitudeCorrectionPlot,
         )
@@ -1,16 +1,27 @@
 import math
 import numpy as np
 import matplotlib as mpl
+import yaml
 
 from astropy.coordinates import AltAz
 import astropy.units as u
 
 from typing import Tuple, Union
 
+try:
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:  # PyYAML was built without libyaml, fall back to the pure Python loader
+    from yaml import SafeLoader as YAMLLoader
+
 
 QuarterTau = math.tau / 4
 
 
+def load_yaml(stream):
+    """ Safely load a YAML document, using the much faster libyaml parser if it is available """
+    return yaml.load(stream, Loader=YAMLLoader)
+
+
 def polar_to_cart(z: np.ndarray, a: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
     return z * np.sin(a), -z * np.cos(a)
 
@@ -18,9 +29,11 @@ def polar_to_cart(z: np.ndarray, a: np.ndarray) -> Tuple[np.ndarray, np.ndarray]
 def by_azimuth(uv):
     uv = np.nan_to_num(uv, nan=0)
     r = np.sqrt(np.sum(np.square(uv), axis=-1))
-    f = (np.arctan2(uv[..., 1], uv[..., 0]) + math.tau) % math.tau
+    f = np.arctan2(uv[..., 1], uv[..., 0])
+    np.mod(f, math.tau, out=f)     # wrap to [0, tau) in place, np.mod is always non-negative for a positive divisor
+    f /= math.tau
     r = r / np.max(r)
-    hsv = np.stack((f / math.tau, r, np.ones_like(r)), axis=1)
+    hsv = np.stack((f, r, np.ones_like(r)), axis=1)
     return mpl.colors.hsv_to_rgb(hsv)
 
 
@@ -54,12 +67,35 @@ def spherical_distance(a: np.ndarray, b: np.ndarray) -> np.ndarray[float]:
     -------
     np.ndarray(A, B)
     """
-    return 2 * np.arcsin(
-        np.sqrt(
-            np.sin(0.5 * (b[..., 0] - a[..., 0]))**2 +
-            np.cos(a[..., 0]) * np.cos(b[..., 0]) * np.sin(0.5 * (b[..., 1] - a[..., 1]))**2
-        )
-    )
+    data_a, data_b = np.ma.getdata(a), np.ma.getdata(b)
+    lat_a, lon_a = data_a[..., 0], data_a[..., 1]
+    lat_b, lon_b = data_b[..., 0], data_b[..., 1]
+
+    # Haversine formula evaluated in place in two full-size buffers, without a temporary for every operation:
+    # for the Matchmaker's all-pairs distances between dots and stars those are arrays of A × B elements
+    h = np.asarray(np.subtract(lat_b, lat_a, dtype=float))
+    h *= 0.5
+    np.sin(h, out=h)
+    np.square(h, out=h)
+
+    t = np.asarray(np.subtract(lon_b, lon_a, dtype=float))
+    t *= 0.5
+    np.sin(t, out=t)
+    np.square(t, out=t)
+    t *= np.cos(lat_a)
+    t *= np.cos(lat_b)
+
+    h += t
+    np.sqrt(h, out=h)
+    np.arcsin(h, out=h)
+    h *= 2
+
+    if np.ma.isMaskedArray(a) or np.ma.isMaskedArray(b):
+        # A distance is masked whenever any coordinate of either of its points is
+        mask = np.ma.getmaskarray(a).any(axis=-1) | np.ma.getmaskarray(b).any(axis=-1)
+        return np.ma.masked_array(h, np.broadcast_to(mask, h.shape).copy())
+    else:
+        return h[()]
 
 
 def spherical_difference(a: np.ndarray, b: np.ndarray) -> np.ndarray:
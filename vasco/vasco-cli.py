@@ -54,10 +54,10 @@ class VascoCLI:
 
     def _process_arguments(self):
         self.args = self.argparser.parse_args()
-        print(self.args)
 
         self.outdir = Path(self.args.outdir)
         log.setLevel(logging.DEBUG if self.args.debug else logging.INFO)
+        log.debug(f"Arguments: {self.args}")
         self.projection = BorovickaProjection.load(self.args.parameters)
 
         self.distance_limit = np.radians(self.args.mask_distant) if self.args.mask_distant is not None else 0
@@ -102,4 +102,5 @@ class VascoCLI:
             ), file)
 
 
-vasco = VascoCLI()
+if __name__ == "__main__":
+    VascoCLI()
@@ -5,22 +5,28 @@ import argparse
 import logger
 
 
-from PyQt6.QtWidgets import QApplication
-from mainwindow import MainWindow
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--debug', action='store_true', default=False)
+    parser.add_argument('-c', '--catalogue', type=argparse.FileType('r'))
+    parser.add_argument('-s', '--sighting', type=argparse.FileType('r'))
+    parser.add_argument('-p', '--projection', type=argparse.FileType('r'))
+    args = parser.parse_args()
 
+    log = logger.setupLog('vasco')
+    log.setLevel(logging.DEBUG if args.debug else logging.INFO)
 
-parser = argparse.ArgumentParser()
-parser.add_argument('--debug', action='store_true', default=False)
-parser.add_argument('-c', '--catalogue', type=argparse.FileType('r'))
-parser.add_argument('-s', '--sighting', type=argparse.FileType('r'))
-parser.add_argument('-p', '--projection', type=argparse.FileType('r'))
-args = parser.parse_args()
+    # Qt, matplotlib and the whole model stack take a good while to import: only do so after the arguments are parsed,
+    # so that --help and argument errors are reported immediately
+    from PyQt6.QtWidgets import QApplication
+    from mainwindow import MainWindow
 
-log = logger.setupLog('vasco')
-log.setLevel(logging.DEBUG if args.debug else logging.INFO)
+    app = QApplication(sys.argv)
+    window = MainWindow(args)
+    window.showMaximized()
 
-app = QApplication(sys.argv)
-window = MainWindow(args)
-window.showMaximized()
+    return app.exec()
 
-app.exec()
+
+if __name__ == "__main__":
+    sys.exit(main())
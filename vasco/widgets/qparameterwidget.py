@@ -27,10 +27,14 @@ class QParameterWidget(QWidget, Ui_Form):
         self.lb_symbol.setText(symbol)
         self.lb_symbol.setBuddy(self.dsb_value)
         self.lb_unit.setText(unit)
+
+        # Changing the range or precision may clamp or round the value: do not emit valueChanged for every setter
+        blocked = self.dsb_value.blockSignals(True)
         self.dsb_value.setMinimum(minimum)
         self.dsb_value.setMaximum(maximum)
         self.dsb_value.setSingleStep(step)
         self.dsb_value.setDecimals(decimals)
+        self.dsb_value.blockSignals(blocked)
 
         self.display_to_true = display_to_true
         self.true_to_display = true_to_display